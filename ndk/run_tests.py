@@ -221,11 +221,10 @@ def print_test_stats(
 ) -> None:
     test_stats: Dict[BuildConfiguration, Dict[str, List[TestCase]]] = {}
     for config, tests in test_groups.items():
-        test_stats[config] = {}
+        config_stats: Dict[str, List[TestCase]] = {}
+        test_stats[config] = config_stats
         for test in tests:
-            if test.build_system not in test_stats[config]:
-                test_stats[config][test.build_system] = []
-            test_stats[config][test.build_system].append(test)
+            config_stats.setdefault(test.build_system, []).append(test)
 
     for config, build_system_groups in test_stats.items():
         print(f"Config {config}:")
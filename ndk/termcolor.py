@@ -18,15 +18,17 @@
 # TODO: Move to ansi.py.
 
 
+_COLORS = {
+    "green": "\033[92m",
+    "red": "\033[91m",
+    "yellow": "\033[93m",
+}
+_END_COLOR = "\033[0m"
+
+
 def color_string(string: str, color: str) -> str:
     """Returns a string that will be colored when printed to a terminal."""
-    colors = {
-        "green": "\033[92m",
-        "red": "\033[91m",
-        "yellow": "\033[93m",
-    }
-    end_color = "\033[0m"
-    return colors[color] + string + end_color
+    return _COLORS[color] + string + _END_COLOR
 
 
 def maybe_color(text: str, color: str, do_color: bool) -> str:
@@ -56,11 +56,10 @@ def write_build_report(build_report: str, results: Report[None]) -> None:
 
 def scan_test_suite(suite_dir: Path, test_scanner: TestScanner) -> List[Test]:
     tests: List[Test] = []
-    for dentry in os.listdir(suite_dir):
-        path = suite_dir / dentry
-        if path.is_dir():
-            test_name = path.name
-            tests.extend(test_scanner.find_tests(path, test_name))
+    with os.scandir(suite_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                tests.extend(test_scanner.find_tests(Path(entry.path), entry.name))
     return tests
 
 
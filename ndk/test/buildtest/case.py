@@ -26,7 +26,7 @@ from abc import ABC, abstractmethod
 from importlib.abc import Loader
 from pathlib import Path
 from subprocess import CompletedProcess
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import ndk.ansi
 import ndk.ext.os
@@ -42,6 +42,14 @@ from ndk.test.result import Failure, Skipped, Success, TestResult
 from ndk.test.spec import BuildConfiguration, CMakeToolchainFile
 
 
+# Loading a test_config.py executes it, and it is consulted several times for every
+# configuration of every test in its directory, so each is loaded once per process.
+_TEST_CONFIGS: Dict[Path, TestConfig] = {}
+
+# APP_PLATFORM from each test's jni/Application.mk, or None if it does not set one.
+_APPLICATION_MK_PLATFORMS: Dict[Path, Optional[int]] = {}
+
+
 def logger() -> logging.Logger:
     """Return the logger for this module."""
     return logging.getLogger(__name__)
@@ -73,7 +81,11 @@ class Test(ABC):
         ...
 
     def get_test_config(self) -> TestConfig:
-        return TestConfig.from_test_dir(self.test_dir)
+        test_config = _TEST_CONFIGS.get(self.test_dir)
+        if test_config is None:
+            test_config = TestConfig.from_test_dir(self.test_dir)
+            _TEST_CONFIGS[self.test_dir] = test_config
+        return test_config
 
     def run(
         self, obj_dir: Path, dist_dir: Path, test_filters: TestFilter
@@ -285,6 +297,9 @@ def _run_build_sh_test(
 def _platform_from_application_mk(test_dir: Path) -> Optional[int]:
     """Determine target API level from a test's Application.mk.
 
+    The result is cached per test directory because it is needed for every build
+    configuration of the test.
+
     Args:
         test_dir: Directory of the test to read.
 
@@ -294,6 +309,12 @@ def _platform_from_application_mk(test_dir: Path) -> Optional[int]:
     Raises:
         ValueError: Found an unexpected value for APP_PLATFORM.
     """
+    if test_dir not in _APPLICATION_MK_PLATFORMS:
+        _APPLICATION_MK_PLATFORMS[test_dir] = _read_application_mk_platform(test_dir)
+    return _APPLICATION_MK_PLATFORMS[test_dir]
+
+
+def _read_application_mk_platform(test_dir: Path) -> Optional[int]:
     application_mk = test_dir / "jni" / "Application.mk"
     if not application_mk.exists():
         return None
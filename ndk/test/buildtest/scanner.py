@@ -15,7 +15,7 @@
 #
 from __future__ import absolute_import
 
-import glob
+import os
 from pathlib import Path
 from typing import List, Set
 
@@ -29,6 +29,15 @@ from ndk.test.buildtest.case import (
 from ndk.test.spec import BuildConfiguration, CMakeToolchainFile
 
 
+def _has_mk_file(directory: str) -> bool:
+    """Returns True if directory contains a *.mk entry, as glob would match it."""
+    with os.scandir(directory) as entries:
+        return any(
+            entry.name.endswith(".mk") and not entry.name.startswith(".")
+            for entry in entries
+        )
+
+
 class TestScanner:
     """Creates a Test objects for a given test directory.
 
@@ -58,14 +67,17 @@ class BuildTestScanner(TestScanner):
         self.build_configurations.add(spec)
 
     def find_tests(self, path: Path, name: str) -> List[Test]:
+        # One directory listing answers every probe below without a stat per
+        # candidate file.
+        with os.scandir(path) as it:
+            entries = {entry.name: entry for entry in it}
+
         # If we have a build.sh, that takes precedence over the Android.mk.
-        build_sh_path = path / "build.sh"
-        if build_sh_path.exists():
+        if "build.sh" in entries:
             return self.make_build_sh_tests(path, name)
 
         # Same for test.py
-        test_py_path = path / "test.py"
-        if test_py_path.exists():
+        if "test.py" in entries:
             return self.make_test_py_tests(path, name)
 
         # But we can have both ndk-build and cmake tests in the same directory.
@@ -74,12 +86,12 @@ class BuildTestScanner(TestScanner):
         # that would mostly be a better test) because we have a test that
         # verifies that ndk-build still works when APP_BUILD_SCRIPT is set to
         # something _other_ than a file named Android.mk.
-        mk_glob = glob.glob(str(path / "jni/*.mk"))
-        if mk_glob:
-            tests.extend(self.make_ndk_build_tests(path, name))
+        jni_entry = entries.get("jni")
+        if jni_entry is not None and jni_entry.is_dir():
+            if _has_mk_file(jni_entry.path):
+                tests.extend(self.make_ndk_build_tests(path, name))
 
-        cmake_lists_path = path / "CMakeLists.txt"
-        if cmake_lists_path.exists():
+        if "CMakeLists.txt" in entries:
             tests.extend(self.make_cmake_tests(path, name))
         return tests
 
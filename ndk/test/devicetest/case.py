@@ -17,7 +17,7 @@ import logging
 import shlex
 import traceback
 from pathlib import Path, PurePosixPath
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 from ndk.test.config import DeviceTestConfig
 from ndk.test.devices import Device, DeviceConfig
@@ -25,6 +25,10 @@ from ndk.test.spec import BuildConfiguration
 
 AdbResult = tuple[int, str, str, str]
 
+# Loading a test_config.py executes it, and every executable in a suite is checked
+# against it for every device, so each is loaded once per process.
+_TEST_CONFIGS: Dict[Path, DeviceTestConfig] = {}
+
 
 def logger() -> logging.Logger:
     """Returns the module logger."""
@@ -120,7 +124,11 @@ class BasicTestCase(TestCase):
         # We don't run anything in tests/build. We can safely assume that anything here
         # is in tests/device.
         test_dir = self.test_src_dir / "device" / self.suite
-        return DeviceTestConfig.from_test_dir(test_dir)
+        test_config = _TEST_CONFIGS.get(test_dir)
+        if test_config is None:
+            test_config = DeviceTestConfig.from_test_dir(test_dir)
+            _TEST_CONFIGS[test_dir] = test_config
+        return test_config
 
     def check_unsupported(self, device: DeviceConfig) -> Optional[str]:
         return self.get_test_config().run_unsupported(self, device)
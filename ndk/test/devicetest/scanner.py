@@ -13,8 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import itertools
 import logging
 import os
+from collections.abc import Iterator
 from pathlib import Path, PurePosixPath
 from typing import Callable, Dict, List
 
@@ -36,17 +38,19 @@ def _enumerate_basic_tests(
     build_cfg: BuildConfiguration,
     build_system: str,
     test_filter: TestFilter,
-) -> List[TestCase]:
-    tests: List[TestCase] = []
+) -> Iterator[TestCase]:
     tests_dir = out_dir_base / str(build_cfg) / build_system
     if not tests_dir.exists():
-        return tests
+        return
 
+    abi = build_cfg.abi
+    # The device layout mirrors tests_dir relative to out_dir_base, so build the
+    # device side of that path once rather than recovering it per test.
+    device_tests_dir = device_base_dir / str(build_cfg) / build_system
     for test_subdir in os.listdir(tests_dir):
         test_dir = tests_dir / test_subdir
-        out_dir = test_dir / build_cfg.abi
-        test_relpath = out_dir.relative_to(out_dir_base)
-        device_dir = device_base_dir / test_relpath
+        out_dir = test_dir / abi
+        device_dir = device_tests_dir / test_subdir / abi
         for test_file in os.listdir(out_dir):
             if test_file.endswith(".so"):
                 continue
@@ -64,25 +68,22 @@ def _enumerate_basic_tests(
             name = ".".join([test_subdir, test_file])
             if not test_filter.filter(name):
                 continue
-            tests.append(
-                BasicTestCase(
-                    test_subdir,
-                    test_file,
-                    test_src_dir,
-                    build_cfg,
-                    build_system,
-                    device_dir,
-                )
+            yield BasicTestCase(
+                test_subdir,
+                test_file,
+                test_src_dir,
+                build_cfg,
+                build_system,
+                device_dir,
             )
-    return tests
 
 
 class ConfigFilter:
     def __init__(self, test_spec: ndk.test.spec.TestSpec) -> None:
-        self.spec = test_spec
+        self.abis = frozenset(test_spec.abis)
 
     def filter(self, build_config: BuildConfiguration) -> bool:
-        return build_config.abi in self.spec.abis
+        return build_config.abi in self.abis
 
 
 def enumerate_tests(
@@ -107,7 +108,7 @@ def enumerate_tests(
         str,
         Callable[
             [Path, Path, PurePosixPath, BuildConfiguration, str, TestFilter],
-            List[TestCase],
+            Iterator[TestCase],
         ],
     ] = {
         "cmake": _enumerate_basic_tests,
@@ -122,11 +123,8 @@ def enumerate_tests(
         if not config_filter.filter(build_cfg):
             continue
 
-        if build_cfg not in tests:
-            tests[build_cfg] = []
-
-        for test_type, scan_for_tests in test_subdir_class_map.items():
-            tests[build_cfg].extend(
+        tests.setdefault(build_cfg, []).extend(
+            itertools.chain.from_iterable(
                 scan_for_tests(
                     test_dir,
                     test_src_dir,
@@ -135,6 +133,8 @@ def enumerate_tests(
                     test_type,
                     test_filter,
                 )
+                for test_type, scan_for_tests in test_subdir_class_map.items()
             )
+        )
 
     return tests
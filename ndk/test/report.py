@@ -49,9 +49,10 @@ class Report(Generic[UserDataT]):
     def by_suite(self) -> Dict[str, Report[UserDataT]]:
         suite_reports: Dict[str, Report[UserDataT]] = {}
         for report in self.reports:
-            if report.suite not in suite_reports:
-                suite_reports[report.suite] = Report()
-            suite_reports[report.suite].add_result(report.suite, report.result)
+            suite_report = suite_reports.get(report.suite)
+            if suite_report is None:
+                suite_report = suite_reports[report.suite] = Report()
+            suite_report.add_result(report.suite, report.result)
         return suite_reports
 
     @property
@@ -33,6 +33,8 @@ class ResultTranslations:
 
 
 class TestResult:
+    __slots__ = ("test",)
+
     def __init__(self, test: Test):
         self.test = test
 
@@ -55,6 +57,8 @@ UserDataT = TypeVar("UserDataT")
 
 
 class Failure(TestResult, Generic[UserDataT]):
+    __slots__ = ("message", "repro_cmd", "_user_data")
+
     def __init__(
         self,
         test: Test,
@@ -87,6 +91,8 @@ class Failure(TestResult, Generic[UserDataT]):
 
 
 class Success(TestResult):
+    __slots__ = ()
+
     def passed(self) -> bool:
         return True
 
@@ -101,6 +107,8 @@ class Success(TestResult):
 
 
 class Skipped(TestResult):
+    __slots__ = ("reason",)
+
     def __init__(self, test: Test, reason: str) -> None:
         super().__init__(test)
         self.reason = reason
@@ -119,6 +127,8 @@ class Skipped(TestResult):
 
 
 class ExpectedFailure(TestResult):
+    __slots__ = ("message", "broken_config", "bug")
+
     def __init__(self, test: Test, message: str, broken_config: str, bug: str) -> None:
         super().__init__(test)
         self.message = message
@@ -142,6 +152,8 @@ class ExpectedFailure(TestResult):
 
 
 class UnexpectedSuccess(TestResult):
+    __slots__ = ("broken_config", "bug")
+
     def __init__(self, test: Test, broken_config: str, bug: str) -> None:
         super().__init__(test)
         self.broken_config = broken_config
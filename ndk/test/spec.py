@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -89,11 +90,10 @@ class TestSpec:
             abis = test_config.get("abis", ndk.abis.ALL_ABIS)
         assert abis is not None
         suites = test_config.get("suites", ndk.test.suites.ALL_SUITES)
-        devices: Dict[int, List[Abi]] = {}
-        for api, device_abis in test_config["devices"].items():
-            devices[int(api)] = []
-            for abi in device_abis:
-                devices[int(api)].append(Abi(abi))
+        devices: Dict[int, List[Abi]] = {
+            int(api): [Abi(abi) for abi in device_abis]
+            for api, device_abis in test_config["devices"].items()
+        }
         return cls(abis, suites, devices)
 
 
@@ -133,7 +133,11 @@ class BuildConfiguration:
             weak_symbol=self.weak_symbol,
         )
 
-    def __str__(self) -> str:
+    @functools.cached_property
+    def _str(self) -> str:
+        # The fields are frozen, so the string form only needs to be built once.
+        # cached_property stores into the instance __dict__ directly, which the
+        # frozen __setattr__ does not intercept.
         return "-".join(
             [
                 self.abi,
@@ -143,6 +147,9 @@ class BuildConfiguration:
             ]
         )
 
+    def __str__(self) -> str:
+        return self._str
+
     @property
     def is_lp32(self) -> bool:
         return self.abi in LP32_ABIS
@@ -13,8 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import itertools
 import unittest
 
+from ndk.abis import ALL_ABIS
 from ndk.test.spec import BuildConfiguration, CMakeToolchainFile, WeakSymbolsConfig
 
 
@@ -43,3 +45,27 @@ class BuildConfigurationTest(unittest.TestCase):
         self.assertEqual(21, config.api)
         self.assertEqual(CMakeToolchainFile.Default, config.toolchain_file)
         self.assertEqual(WeakSymbolsConfig.WeakAPI, config.weak_symbol)
+
+    def test_from_string_all_configurations(self) -> None:
+        for abi, api, toolchain_file, weak_symbol in itertools.product(
+            ALL_ABIS, (16, 21, 35), CMakeToolchainFile, WeakSymbolsConfig
+        ):
+            config_string = f"{abi}-{api}-{toolchain_file.value}-{weak_symbol.value}"
+            with self.subTest(config_string=config_string):
+                self.assertEqual(
+                    BuildConfiguration(abi, api, toolchain_file, weak_symbol),
+                    BuildConfiguration.from_string(config_string),
+                )
+
+    def test_str_round_trip(self) -> None:
+        config_string = "armeabi-v7a-16-legacy-strictapi"
+        config = BuildConfiguration.from_string(config_string)
+        self.assertEqual(config_string, str(config))
+        # Repeated calls must return the cached value, and caching it must not
+        # leak into equality or hashing.
+        self.assertEqual(config_string, str(config))
+        self.assertEqual(BuildConfiguration.from_string(config_string), config)
+        self.assertEqual(
+            hash(BuildConfiguration.from_string(config_string)), hash(config)
+        )
+        self.assertEqual("armeabi-v7a-21-legacy-strictapi", str(config.with_api(21)))
@@ -18,12 +18,9 @@ import multiprocessing
 import os
 import signal
 import sys
-import time
 import unittest
 from queue import Queue
 from threading import Event
-from types import FrameType
-from typing import Optional
 
 from ndk.workqueue import BasicWorkQueue, TaskError, Worker, WorkQueue
 
@@ -57,19 +54,16 @@ def update_status(
     finish_event.wait()
 
 
-def sigterm_handler(_signum: int, _trace: Optional[FrameType]) -> None:
-    """Raises SystemExit."""
-    sys.exit()
-
-
 def sleep_until_sigterm(pid_queue: Queue[int]) -> None:
-    """Sleeps until signalled, then passes the PID through the queue."""
-    signal.signal(signal.SIGTERM, sigterm_handler)
-    try:
-        while True:
-            time.sleep(60)  # There is no signal.pause() on Windows :(
-    finally:
-        pid_queue.put(os.getpid())
+    """Reports the PID, waits for SIGTERM, then reports the PID again.
+
+    SIGTERM must already be blocked so that a signal sent before this process
+    reaches sigwait() is held pending rather than lost.
+    """
+    pid_queue.put(os.getpid())
+    signal.sigwait([signal.SIGTERM])
+    pid_queue.put(os.getpid())
+    sys.exit()
 
 
 def spawn_child(_worker: Worker, pid_queue: Queue[int]) -> None:
@@ -80,8 +74,8 @@ def spawn_child(_worker: Worker, pid_queue: Queue[int]) -> None:
     PIDs will be passed through the queue again to inform the caller that both
     processes were signalled.
     """
+    signal.pthread_sigmask(signal.SIG_BLOCK, [signal.SIGTERM])
     os.fork()
-    pid_queue.put(os.getpid())
     sleep_until_sigterm(pid_queue)
 
 
@@ -99,12 +93,7 @@ class WorkQueueTest(unittest.TestCase):
 
         workqueue.add_task(put, 1)
         workqueue.add_task(put, 2)
-        expected_results = [1, 2]
-
-        while expected_results:
-            i = workqueue.get_result()
-            self.assertIn(i, expected_results)
-            expected_results.remove(i)
+        self.assertEqual({1, 2}, {workqueue.get_result(), workqueue.get_result()})
 
         workqueue.terminate()
         workqueue.join()
@@ -115,12 +104,7 @@ class WorkQueueTest(unittest.TestCase):
 
         workqueue.add_task(Functor(1))
         workqueue.add_task(Functor(2))
-        expected_results = [1, 2]
-
-        while expected_results:
-            i = workqueue.get_result()
-            self.assertIn(i, expected_results)
-            expected_results.remove(i)
+        self.assertEqual({1, 2}, {workqueue.get_result(), workqueue.get_result()})
 
         workqueue.terminate()
         workqueue.join()
@@ -160,6 +144,7 @@ class WorkQueueTest(unittest.TestCase):
         workqueue.terminate()
         workqueue.join()
 
+    @unittest.skipIf(sys.platform == "win32", "spawn_child requires os.fork")
     def test_subprocesses_killed(self) -> None:
         """Tests that terminate() kills descendents of worker processes."""
         workqueue = WorkQueue(4)
@@ -204,12 +189,7 @@ class BasicWorkQueueTest(unittest.TestCase):
 
         workqueue.add_task(put, 1)
         workqueue.add_task(put, 2)
-        expected_results = [1, 2]
-
-        while expected_results:
-            i = workqueue.get_result()
-            self.assertIn(i, expected_results)
-            expected_results.remove(i)
+        self.assertEqual({1, 2}, {workqueue.get_result(), workqueue.get_result()})
 
         workqueue.terminate()
         workqueue.join()
@@ -220,12 +200,7 @@ class BasicWorkQueueTest(unittest.TestCase):
 
         workqueue.add_task(Functor(1))
         workqueue.add_task(Functor(2))
-        expected_results = [1, 2]
-
-        while expected_results:
-            i = workqueue.get_result()
-            self.assertIn(i, expected_results)
-            expected_results.remove(i)
+        self.assertEqual({1, 2}, {workqueue.get_result(), workqueue.get_result()})
 
         workqueue.terminate()
         workqueue.join()
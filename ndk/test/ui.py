@@ -39,6 +39,12 @@ class TestProgressUi(Ui):
         self.show_worker_status = show_worker_status
         self.show_device_groups = show_device_groups
         self.workqueue = workqueue
+        # ShardingWorkQueue creates all of its groups in its constructor, so the
+        # display order and labels can be computed once rather than on every frame.
+        self.group_ids = {
+            group: f"{len(group.shards)} devices {group}"
+            for group in sorted(self.workqueue.task_queues.keys(), key=str)
+        }
 
     def get_ui_lines(self) -> List[str]:
         lines = []
@@ -46,32 +52,27 @@ class TestProgressUi(Ui):
         if self.show_worker_status:
             for group, group_queues in self.workqueue.work_queues.items():
                 for device, work_queue in group_queues.items():
+                    # Each status read is a round trip to the multiprocessing
+                    # manager, so read each worker's status once per frame.
+                    statuses = [w.status for w in work_queue.workers]
                     style = font_bold()
-                    if all(w.status == Worker.IDLE_STATUS for w in work_queue.workers):
+                    if all(status == Worker.IDLE_STATUS for status in statuses):
                         style = font_faint()
                     lines.append(f"{style}{device}{font_reset()}")
-                    for worker in work_queue.workers:
+                    for status in statuses:
                         style = ""
-                        if worker.status == Worker.IDLE_STATUS:
+                        if status == Worker.IDLE_STATUS:
                             style = font_faint()
-                        lines.append(f"  {style}{worker.status}{font_reset()}")
+                        lines.append(f"  {style}{status}{font_reset()}")
 
         lines.append(
-            "{: >{width}} tests remaining".format(
-                self.workqueue.num_tasks, width=self.NUM_TESTS_DIGITS
-            )
+            f"{self.workqueue.num_tasks: >{self.NUM_TESTS_DIGITS}} tests remaining"
         )
 
         if self.show_device_groups:
-            for group in sorted(self.workqueue.task_queues.keys(), key=str):
-                group_id = f"{len(group.shards)} devices {group}"
-                lines.append(
-                    "{: >{width}} {}".format(
-                        self.workqueue.task_queues[group].qsize(),
-                        group_id,
-                        width=self.NUM_TESTS_DIGITS,
-                    )
-                )
+            for group, group_id in self.group_ids.items():
+                qsize = self.workqueue.task_queues[group].qsize()
+                lines.append(f"{qsize: >{self.NUM_TESTS_DIGITS}} {group_id}")
 
         return lines
 